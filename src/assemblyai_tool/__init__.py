@@ -1,94 +1,48 @@
-from pathlib import Path
-import typing as t
-import typer
-import dotenv
-import assemblyai as aai
+from __future__ import annotations
+
+import asyncio
+import code
+import functools
 import os
+import secrets
 import sys
-import code
-import json
-from enum import Enum
-from importlib.metadata import version, PackageNotFoundError
-import threading
-import time
-import httpx
-from tqdm import tqdm
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+import typing as t
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+import typer
+
+from .batch import BatchRunner, find_batch_files
+from .options import (
+    BoostParam,
+    OutputFormat,
+    SpeechModelChoice,
+    TranscribeOptions,
+    _build_config,
+)
+from .output import OUTPUT_EXTENSIONS, write_output
+from .transcription import make_transcript
+from .transcripts import (
+    TRANSCRIPT_LIST_LIMIT,
+    _cache_transcript_ids,
+    _iter_transcript_pages,
+    _resolve_transcript_id,
+)
+from .webhook import WEBHOOK_AUTH_HEADER, _WebhookReceiver
 
 app = typer.Typer()
 
 
-class OutputFormat(str, Enum):
-    """Output format options"""
-
-    utterances = "utterances"
-    paragraphs = "paragraphs"
-    text = "text"
-    srt = "srt"
-    vtt = "vtt"
-    json_format = "json"
-
-
-class SpeechModelChoice(str, Enum):
-    """Speech model options"""
-
-    best = "best"
-    nano = "nano"
-    slam_1 = "slam-1"
-    universal = "universal"
-
-
-class BoostParam(str, Enum):
-    """Word boost parameter options"""
-
-    low = "low"
-    default = "default"
-    high = "high"
-
-
-AUDIO_EXTENSIONS = {
-    ".mp3",
-    ".mp4",
-    ".m4a",
-    ".wav",
-    ".flac",
-    ".aac",
-    ".ogg",
-    ".opus",
-    ".webm",
-    ".wma",
-}
-
-
-@dataclass
-class TranscribeOptions:
-    """Shared transcription options"""
-
-    format: OutputFormat
-    speech_model: SpeechModelChoice
-    language_code: t.Optional[str]
-    language_detection: bool
-    audio_start_from: t.Optional[int]
-    audio_end_at: t.Optional[int]
-    punctuate: bool
-    word_boost: t.Optional[str]
-    boost_param: BoostParam
-    custom_spelling: t.Optional[str]
-    speaker_labels: bool
-    speakers_expected: t.Optional[int]
-    sentiment_analysis: bool
-    entity_detection: bool
-    auto_chapters: bool
-    auto_highlights: bool
-    show_progress: bool
-    rate_limit_kbps: float
-    rate_limit_ratio: t.Optional[float]
-
-
-def load_api_key() -> None:
+def load_api_key() -> str:
     if os.environ.get("ASSEMBLY_AI_KEY"):
         return os.environ["ASSEMBLY_AI_KEY"]
+    return _load_dotenv_api_key()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_dotenv_api_key() -> str:
+    import dotenv
+
     vars = dotenv.dotenv_values()
     if vars.get("ASSEMBLY_AI_KEY"):
         return vars["ASSEMBLY_AI_KEY"]
@@ -100,426 +54,30 @@ def load_api_key() -> None:
     raise RuntimeError("No API key found")
 
 
-def parse_custom_spelling(spelling_str: str) -> dict:
-    """Parse custom spelling string format: 'from1:to1,from2:to2'"""
-    result = {}
-    if not spelling_str:
-        return result
-
-    for pair in spelling_str.split(","):
-        if ":" not in pair:
-            continue
-        from_word, to_word = pair.split(":", 1)
-        result[to_word.strip()] = from_word.strip()
-
-    return result
-
-
-_upload_progress_bars = threading.local()
-
-
-def _get_upload_progress_bar() -> t.Optional[tqdm]:
-    """Get the thread-local upload progress bar."""
-    return getattr(_upload_progress_bars, "bar", None)
-
-
-def _set_upload_progress_bar(bar: t.Optional[tqdm]) -> None:
-    """Set the thread-local upload progress bar."""
-    _upload_progress_bars.bar = bar
-
-
-class _RateLimiter:
-    """Rate limiter supporting fixed kbps limit or ratio of first upload speed."""
-
-    def __init__(self, rate_limit_kbps: float, rate_limit_ratio: t.Optional[float]):
-        self.rate_limit_kbps = rate_limit_kbps
-        self.rate_limit_ratio = rate_limit_ratio
-        self.first_upload_speed_kbps = None
-        self.lock = threading.Lock()
-        self.effective_limit_kbps = None
-
-    def set_first_upload_speed(self, speed_kbps: float) -> None:
-        """Set the speed observed during first upload."""
-        with self.lock:
-            if self.first_upload_speed_kbps is None:
-                self.first_upload_speed_kbps = speed_kbps
-                if self.rate_limit_ratio is not None:
-                    self.effective_limit_kbps = speed_kbps * self.rate_limit_ratio
-
-    def get_delay_for_bytes(self, num_bytes: int) -> float:
-        """Calculate delay needed for given byte count based on current rate limit."""
-        with self.lock:
-            limit_kbps = self.rate_limit_kbps
-            if limit_kbps == 0 and self.effective_limit_kbps is not None:
-                limit_kbps = self.effective_limit_kbps
-
-            if limit_kbps == 0:
-                return 0.0
-
-            bytes_per_second = limit_kbps * 1024
-            return num_bytes / bytes_per_second
-
-    def get_limit_mbps(self) -> t.Optional[float]:
-        """Get current effective rate limit in Mbps for display."""
-        with self.lock:
-            limit_kbps = self.rate_limit_kbps
-            if limit_kbps == 0 and self.effective_limit_kbps is not None:
-                limit_kbps = self.effective_limit_kbps
-
-            if limit_kbps == 0:
-                return None
-
-            return limit_kbps / 1024
-
-
-class _ProgressFileReader:
-    """Wrapper that tracks read progress for file uploads."""
-
-    def __init__(
-        self,
-        file_path: str,
-        progress_bar: t.Optional[tqdm],
-        rate_limiter: t.Optional[_RateLimiter] = None,
-        is_first_upload: bool = False,
-    ):
-        self.file = open(file_path, "rb")
-        self.progress_bar = progress_bar
-        self.size = os.path.getsize(file_path)
-        self.rate_limiter = rate_limiter
-        self.is_first_upload = is_first_upload
-        self.total_bytes_read = 0
-        self.start_time = time.time()
-
-    def read(self, size: int = -1) -> bytes:
-        data = self.file.read(size)
-        if not data:
-            return data
-
-        self.total_bytes_read += len(data)
-
-        if self.rate_limiter and not self.is_first_upload:
-            delay = self.rate_limiter.get_delay_for_bytes(len(data))
-            if delay > 0:
-                time.sleep(delay)
-
-        if self.progress_bar:
-            self.progress_bar.update(len(data))
-            self._update_display()
-
-        return data
-
-    def _update_display(self):
-        """Update progress bar with rate limit information."""
-        if not self.progress_bar:
-            return
-
-        if self.rate_limiter:
-            limit_mbps = self.rate_limiter.get_limit_mbps()
-            if limit_mbps is not None:
-                self.progress_bar.set_postfix_str(f"{limit_mbps:.1f}M lmt")
-
-    def get_upload_speed_kbps(self) -> float:
-        """Calculate average upload speed in kbps."""
-        elapsed = time.time() - self.start_time
-        if elapsed == 0:
-            return 0.0
-        bytes_per_second = self.total_bytes_read / elapsed
-        return bytes_per_second / 1024
-
-    def __iter__(self):
-        chunk_size = 8192
-        while True:
-            chunk = self.read(chunk_size)
-            if not chunk:
-                break
-            yield chunk
-
-    def close(self):
-        self.file.close()
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
-
-
-def upload_file_with_progress(
-    inpath: str,
-    show_progress: bool,
-    rate_limit_kbps: float = 0.0,
-    rate_limit_ratio: t.Optional[float] = None,
-    is_first_upload: bool = False,
-    shared_rate_limiter: t.Optional[_RateLimiter] = None,
-) -> t.Tuple[str, float]:
-    """Upload a file to AssemblyAI with progress tracking.
-
-    Returns tuple of (upload_url, speed_kbps).
-    """
-    file_size = os.path.getsize(inpath)
-
-    progress_bar = None
-    if show_progress:
-        progress_bar = tqdm(
-            total=file_size,
-            unit="B",
-            unit_scale=True,
-            unit_divisor=1024,
-            desc="Uploading",
-        )
-        _set_upload_progress_bar(progress_bar)
-
-    rate_limiter = shared_rate_limiter
-    if rate_limiter is None and (rate_limit_kbps > 0 or rate_limit_ratio is not None):
-        rate_limiter = _RateLimiter(rate_limit_kbps, rate_limit_ratio)
-
-    try:
-        client = aai.Client.get_default()
-        http_client = client.http_client
-
-        custom_client = httpx.Client(
-            base_url=str(http_client.base_url),
-            headers=http_client.headers,
-            timeout=http_client.timeout,
-        )
-
-        with _ProgressFileReader(
-            inpath, progress_bar, rate_limiter, is_first_upload
-        ) as f:
-            response = custom_client.post("/v2/upload", content=f)
-            upload_speed_kbps = f.get_upload_speed_kbps()
-
-        if response.status_code != httpx.codes.OK:
-            raise RuntimeError(f"Upload failed: {response.text}")
-
-        upload_url = response.json()["upload_url"]
-
-        if progress_bar:
-            progress_bar.close()
-            _set_upload_progress_bar(None)
-
-        return upload_url, upload_speed_kbps
-
-    except Exception:
-        if progress_bar:
-            progress_bar.close()
-            _set_upload_progress_bar(None)
-        raise
-
-
-def make_transcript(
-    inpath: str,
-    speech_model: SpeechModelChoice,
-    language_code: t.Optional[str],
-    language_detection: bool,
-    audio_start_from: t.Optional[int],
-    audio_end_at: t.Optional[int],
-    punctuate: bool,
-    word_boost: t.Optional[list[str]],
-    boost_param: BoostParam,
-    custom_spelling: t.Optional[dict],
-    speaker_labels: bool,
-    speakers_expected: t.Optional[int],
-    sentiment_analysis: bool,
-    entity_detection: bool,
-    auto_chapters: bool,
-    auto_highlights: bool,
-    show_progress: bool,
-    rate_limit_kbps: float = 0.0,
-    rate_limit_ratio: t.Optional[float] = None,
-) -> aai.Transcript:
-    """Create a transcript with the specified configuration."""
-
-    speech_model_map = {
-        SpeechModelChoice.best: aai.SpeechModel.best,
-        SpeechModelChoice.nano: aai.SpeechModel.nano,
-        SpeechModelChoice.slam_1: aai.SpeechModel.slam_1,
-        SpeechModelChoice.universal: aai.SpeechModel.universal,
-    }
-
-    config_params = {
-        "speech_model": speech_model_map[speech_model],
-        "punctuate": punctuate,
-        "speaker_labels": speaker_labels,
-        "sentiment_analysis": sentiment_analysis,
-        "entity_detection": entity_detection,
-        "auto_chapters": auto_chapters,
-        "auto_highlights": auto_highlights,
-    }
-
-    if language_code:
-        config_params["language_code"] = language_code
-    else:
-        config_params["language_detection"] = language_detection
-
-    if audio_start_from is not None:
-        config_params["audio_start_from"] = audio_start_from
-    if audio_end_at is not None:
-        config_params["audio_end_at"] = audio_end_at
-
-    if word_boost:
-        config_params["word_boost"] = word_boost
-        config_params["boost_param"] = getattr(aai.types.WordBoost, boost_param.value)
-
-    if custom_spelling:
-        config_params["custom_spelling"] = custom_spelling
-
-    if speakers_expected is not None:
-        config_params["speakers_expected"] = speakers_expected
-
-    config = aai.TranscriptionConfig(**config_params)
-    transcriber = aai.Transcriber(config=config)
-
-    upload_url, _ = upload_file_with_progress(
-        str(inpath), show_progress, rate_limit_kbps, rate_limit_ratio
-    )
-
-    processing_bar = None
-    if show_progress:
-        processing_bar = tqdm(
-            total=100,
-            unit="%",
-            desc="Processing",
-            bar_format="{l_bar}{bar}| {n:.0f}/{total:.0f}%",
-        )
-
-    transcript = transcriber.submit(upload_url)
-
-    if show_progress:
-        polling_interval = aai.settings.polling_interval
-        started_processing = False
-
-        while transcript.status not in (
-            aai.TranscriptStatus.completed,
-            aai.TranscriptStatus.error,
-        ):
-            time.sleep(polling_interval)
-
-            client = aai.Client.get_default()
-            response = client.http_client.get(f"/v2/transcript/{transcript.id}")
-            if response.status_code == 200:
-                transcript_data = response.json()
-                transcript = aai.Transcript.from_response(
-                    client=client,
-                    response=aai.types.TranscriptResponse.parse_obj(transcript_data),
-                )
-
-            if transcript.status == aai.TranscriptStatus.processing:
-                if not started_processing:
-                    started_processing = True
-                    if processing_bar:
-                        processing_bar.update(30)
-                elif processing_bar and processing_bar.n < 90:
-                    processing_bar.update(10)
-
-        if transcript.status == aai.TranscriptStatus.completed and processing_bar:
-            processing_bar.n = 100
-            processing_bar.refresh()
-
-        if processing_bar:
-            processing_bar.close()
-
-        if transcript.status == aai.TranscriptStatus.completed:
-            duration_mins = (
-                transcript.audio_duration / 60 if transcript.audio_duration else 0
-            )
-            print(f"✓ Transcription complete ({duration_mins:.1f} minutes)")
-    else:
-        transcript = transcript.wait_for_completion()
-
-    return transcript
-
-
-def format_output(
-    transcript: aai.Transcript,
-    output_format: OutputFormat,
-    speaker_labels: bool,
-) -> str:
-    """Format transcript based on output format choice."""
-
-    if output_format == OutputFormat.text:
-        return transcript.text
-
-    elif output_format == OutputFormat.paragraphs:
-        paragraphs = transcript.get_paragraphs()
-        if speaker_labels and transcript.utterances:
-            # Group paragraphs by speaker
-            output = []
-            for para in paragraphs:
-                output.append(f"{para.text}\n")
-            return "\n".join(output)
-        else:
-            return "\n\n".join(p.text for p in paragraphs)
-
-    elif output_format == OutputFormat.srt:
-        return transcript.export_subtitles_srt()
-
-    elif output_format == OutputFormat.vtt:
-        return transcript.export_subtitles_vtt()
-
-    elif output_format == OutputFormat.json_format:
-        return json.dumps(transcript.json_response, indent=2)
-
-    elif transcript.utterances:
-        output = []
-        for utterance in transcript.utterances:
-            if speaker_labels:
-                output.append(f"Speaker {utterance.speaker}: {utterance.text}\n")
-            else:
-                output.append(f"{utterance.text}\n")
-        return "\n".join(output)
-
-    else:
-        return transcript.text
-
-
 def process_single_file(
     inpath: Path,
     outpath: Path,
     opts: TranscribeOptions,
 ) -> None:
     """Process a single audio file with the given options."""
-    word_boost_list = None
-    if opts.word_boost:
-        word_boost_list = [w.strip() for w in opts.word_boost.split(",")]
-
-    custom_spelling_dict = None
-    if opts.custom_spelling:
-        custom_spelling_dict = parse_custom_spelling(opts.custom_spelling)
+    import assemblyai as aai
 
     transcript = make_transcript(
-        inpath=str(inpath),
-        speech_model=opts.speech_model,
-        language_code=opts.language_code,
-        language_detection=opts.language_detection,
-        audio_start_from=opts.audio_start_from,
-        audio_end_at=opts.audio_end_at,
-        punctuate=opts.punctuate,
-        word_boost=word_boost_list,
-        boost_param=opts.boost_param,
-        custom_spelling=custom_spelling_dict,
-        speaker_labels=opts.speaker_labels,
-        speakers_expected=opts.speakers_expected,
-        sentiment_analysis=opts.sentiment_analysis,
-        entity_detection=opts.entity_detection,
-        auto_chapters=opts.auto_chapters,
-        auto_highlights=opts.auto_highlights,
-        show_progress=opts.show_progress,
-        rate_limit_kbps=opts.rate_limit_kbps,
-        rate_limit_ratio=opts.rate_limit_ratio,
+        str(inpath),
+        _build_config(opts),
+        opts.show_progress,
+        opts.rate_limit_kbps,
+        opts.rate_limit_ratio,
     )
 
     if transcript.status == aai.TranscriptStatus.error:
         print(f"Error: {transcript.error}", file=sys.stderr)
         raise typer.Exit(1)
 
-    output_text = format_output(transcript, opts.format, opts.speaker_labels)
-
     if opts.show_progress:
         print(f"Saving to {outpath}")
 
-    with open(outpath, "w") as f:
-        f.write(output_text)
+    write_output(transcript, opts.format, opts.speaker_labels, outpath)
 
 
 @app.command()
@@ -537,7 +95,7 @@ def convert(
         SpeechModelChoice, typer.Option(help="Speech model to use")
     ] = SpeechModelChoice.best,
     language_code: t.Annotated[
-        t.Optional[str],
+        str | None,
         typer.Option(
             help="Language code (e.g., en, es, fr). Overrides language-detection"
         ),
@@ -547,10 +105,10 @@ def convert(
     ] = False,
     # Audio slicing
     audio_start_from: t.Annotated[
-        t.Optional[int], typer.Option(help="Start transcription from this millisecond")
+        int | None, typer.Option(help="Start transcription from this millisecond")
     ] = None,
     audio_end_at: t.Annotated[
-        t.Optional[int], typer.Option(help="End transcription at this millisecond")
+        int | None, typer.Option(help="End transcription at this millisecond")
     ] = None,
     # Text formatting
     punctuate: t.Annotated[
@@ -558,14 +116,14 @@ def convert(
     ] = True,
     # Custom vocabulary
     word_boost: t.Annotated[
-        t.Optional[str],
+        str | None,
         typer.Option(help="Comma-separated list of words/phrases to boost accuracy"),
     ] = None,
     boost_param: t.Annotated[
         BoostParam, typer.Option(help="Weight to apply to boosted words")
     ] = BoostParam.default,
     custom_spelling: t.Annotated[
-        t.Optional[str],
+        str | None,
         typer.Option(help="Custom spelling mappings (format: 'from1:to1,from2:to2')"),
     ] = None,
     # Speaker diarization
@@ -573,7 +131,7 @@ def convert(
         bool, typer.Option(help="Enable speaker diarization")
     ] = False,
     speakers_expected: t.Annotated[
-        t.Optional[int], typer.Option(help="Expected number of speakers (2-10)")
+        int | None, typer.Option(help="Expected number of speakers (2-10)")
     ] = None,
     # Content analysis
     sentiment_analysis: t.Annotated[
@@ -642,7 +200,7 @@ def batch(
         SpeechModelChoice, typer.Option(help="Speech model to use")
     ] = SpeechModelChoice.best,
     language_code: t.Annotated[
-        t.Optional[str],
+        str | None,
         typer.Option(
             help="Language code (e.g., en, es, fr). Overrides language-detection"
         ),
@@ -651,30 +209,30 @@ def batch(
         bool, typer.Option(help="Enable automatic language detection")
     ] = False,
     audio_start_from: t.Annotated[
-        t.Optional[int], typer.Option(help="Start transcription from this millisecond")
+        int | None, typer.Option(help="Start transcription from this millisecond")
     ] = None,
     audio_end_at: t.Annotated[
-        t.Optional[int], typer.Option(help="End transcription at this millisecond")
+        int | None, typer.Option(help="End transcription at this millisecond")
     ] = None,
     punctuate: t.Annotated[
         bool, typer.Option(help="Enable automatic punctuation")
     ] = True,
     word_boost: t.Annotated[
-        t.Optional[str],
+        str | None,
         typer.Option(help="Comma-separated list of words/phrases to boost accuracy"),
     ] = None,
     boost_param: t.Annotated[
         BoostParam, typer.Option(help="Weight to apply to boosted words")
     ] = BoostParam.default,
     custom_spelling: t.Annotated[
-        t.Optional[str],
+        str | None,
         typer.Option(help="Custom spelling mappings (format: 'from1:to1,from2:to2')"),
     ] = None,
     speaker_labels: t.Annotated[
         bool, typer.Option(help="Enable speaker diarization")
     ] = False,
     speakers_expected: t.Annotated[
-        t.Optional[int], typer.Option(help="Expected number of speakers (2-10)")
+        int | None, typer.Option(help="Expected number of speakers (2-10)")
     ] = None,
     sentiment_analysis: t.Annotated[
         bool, typer.Option(help="Enable sentiment analysis")
@@ -699,8 +257,22 @@ def batch(
             help="Rate limit ratio of first upload speed (0.0-1.0, 1.0 = no limit)"
         ),
     ] = 1.0,
+    webhook_url: t.Annotated[
+        str | None,
+        typer.Option(
+            help="Public URL forwarding to --webhook-port, to be notified instead of polling"
+        ),
+    ] = None,
+    webhook_host: t.Annotated[
+        str, typer.Option(help="Local address to receive webhooks on")
+    ] = "127.0.0.1",
+    webhook_port: t.Annotated[
+        int, typer.Option(help="Local port to receive webhooks on")
+    ] = 8000,
 ) -> None:
     """Batch convert audio files from input directory to output directory."""
+    from tqdm import tqdm
+
     if rate_limit_ratio <= 0 or rate_limit_ratio > 1.0:
         print(
             "Error: --rate-limit-ratio must be between 0 (exclusive) and 1.0",
@@ -708,15 +280,19 @@ def batch(
         )
         raise typer.Exit(1)
 
-    output_dir.mkdir(parents=True, exist_ok=True)
+    if upload_concurrency < 1 or processing_concurrency < 1:
+        print(
+            "Error: --upload-concurrency and --processing-concurrency must be at least 1",
+            file=sys.stderr,
+        )
+        raise typer.Exit(1)
 
-    audio_files = [
-        f
-        for f in input_dir.iterdir()
-        if f.is_file() and f.suffix.lower() in AUDIO_EXTENSIONS
-    ]
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-    if not audio_files:
+    file_pairs, skipped_count = find_batch_files(
+        input_dir, output_dir, OUTPUT_EXTENSIONS[format], force
+    )
+    if not file_pairs and not skipped_count:
         print("No audio files found in input directory")
         return
 
@@ -742,206 +318,55 @@ def batch(
         rate_limit_ratio=rate_limit_ratio if rate_limit_ratio < 1.0 else None,
     )
 
-    output_ext_map = {
-        OutputFormat.text: ".txt",
-        OutputFormat.paragraphs: ".txt",
-        OutputFormat.utterances: ".txt",
-        OutputFormat.srt: ".srt",
-        OutputFormat.vtt: ".vtt",
-        OutputFormat.json_format: ".json",
-    }
-    output_ext = output_ext_map[format]
-
-    file_pairs = [(f, output_dir / f"{f.stem}{output_ext}") for f in audio_files]
-
-    if not force:
-        skipped_files = [
-            (inpath, outpath) for inpath, outpath in file_pairs if outpath.exists()
-        ]
-        file_pairs = [
-            (inpath, outpath) for inpath, outpath in file_pairs if not outpath.exists()
-        ]
-
-        if skipped_files and show_progress:
-            print(
-                f"Skipping {len(skipped_files)} existing file(s) (use --force to overwrite)"
-            )
+    if skipped_count and show_progress:
+        print(f"Skipping {skipped_count} existing file(s) (use --force to overwrite)")
 
     if not file_pairs:
         print("No files to process")
         return
 
-    upload_semaphore = threading.Semaphore(upload_concurrency)
-    processing_semaphore = threading.Semaphore(processing_concurrency)
-
-    uploading_count = 0
-    processing_count = 0
-    completed_count = 0
-    failed_count = 0
-    count_lock = threading.Lock()
-    first_upload_done = False
-    rate_limiter_shared = None
-    if opts.rate_limit_kbps > 0 or opts.rate_limit_ratio is not None:
-        rate_limiter_shared = _RateLimiter(opts.rate_limit_kbps, opts.rate_limit_ratio)
-
-    def update_progress_desc():
-        with count_lock:
-            return f"{uploading_count} u/l; {processing_count} asr"
+    config = _build_config(opts)
+    webhooks = None
+    if webhook_url:
+        webhooks = _WebhookReceiver(secrets.token_urlsafe(), webhook_host, webhook_port)
+        config.set_webhook(webhook_url, WEBHOOK_AUTH_HEADER, webhooks.token)
 
     progress_bar = (
         tqdm(total=len(file_pairs), desc="", unit="file") if show_progress else None
     )
-
-    def process_file(inpath: Path, outpath: Path):
-        nonlocal \
-            uploading_count, \
-            processing_count, \
-            completed_count, \
-            failed_count, \
-            first_upload_done
-
-        try:
-            with upload_semaphore:
-                with count_lock:
-                    uploading_count += 1
-                    is_first = not first_upload_done
-                if progress_bar:
-                    progress_bar.set_postfix_str(update_progress_desc())
-
-                upload_url, speed_kbps = upload_file_with_progress(
-                    str(inpath),
-                    False,
-                    opts.rate_limit_kbps,
-                    opts.rate_limit_ratio,
-                    is_first,
-                    rate_limiter_shared,
-                )
-
-                if is_first and rate_limiter_shared:
-                    rate_limiter_shared.set_first_upload_speed(speed_kbps)
-
-                with count_lock:
-                    uploading_count -= 1
-                    processing_count += 1
-                    if is_first:
-                        first_upload_done = True
-                if progress_bar:
-                    progress_bar.set_postfix_str(update_progress_desc())
-
-            with processing_semaphore:
-                word_boost_list = None
-                if opts.word_boost:
-                    word_boost_list = [w.strip() for w in opts.word_boost.split(",")]
-
-                custom_spelling_dict = None
-                if opts.custom_spelling:
-                    custom_spelling_dict = parse_custom_spelling(opts.custom_spelling)
-
-                speech_model_map = {
-                    SpeechModelChoice.best: aai.SpeechModel.best,
-                    SpeechModelChoice.nano: aai.SpeechModel.nano,
-                    SpeechModelChoice.slam_1: aai.SpeechModel.slam_1,
-                    SpeechModelChoice.universal: aai.SpeechModel.universal,
-                }
-
-                config_params = {
-                    "speech_model": speech_model_map[opts.speech_model],
-                    "punctuate": opts.punctuate,
-                    "speaker_labels": opts.speaker_labels,
-                    "sentiment_analysis": opts.sentiment_analysis,
-                    "entity_detection": opts.entity_detection,
-                    "auto_chapters": opts.auto_chapters,
-                    "auto_highlights": opts.auto_highlights,
-                }
-
-                if opts.language_code:
-                    config_params["language_code"] = opts.language_code
-                else:
-                    config_params["language_detection"] = opts.language_detection
-
-                if opts.audio_start_from is not None:
-                    config_params["audio_start_from"] = opts.audio_start_from
-                if opts.audio_end_at is not None:
-                    config_params["audio_end_at"] = opts.audio_end_at
-
-                if word_boost_list:
-                    config_params["word_boost"] = word_boost_list
-                    config_params["boost_param"] = getattr(
-                        aai.types.WordBoost, opts.boost_param.value
-                    )
-
-                if custom_spelling_dict:
-                    config_params["custom_spelling"] = custom_spelling_dict
-
-                if opts.speakers_expected is not None:
-                    config_params["speakers_expected"] = opts.speakers_expected
-
-                config = aai.TranscriptionConfig(**config_params)
-                transcriber = aai.Transcriber(config=config)
-
-                transcript = transcriber.submit(upload_url)
-                transcript = transcript.wait_for_completion()
-
-                with count_lock:
-                    processing_count -= 1
-                if progress_bar:
-                    progress_bar.set_postfix_str(update_progress_desc())
-
-                if transcript.status == aai.TranscriptStatus.error:
-                    with count_lock:
-                        failed_count += 1
-                    if progress_bar:
-                        progress_bar.write(
-                            f"Error processing {inpath.name}: {transcript.error}"
-                        )
-                    return
-
-                output_text = format_output(
-                    transcript, opts.format, opts.speaker_labels
-                )
-                with open(outpath, "w") as f:
-                    f.write(output_text)
-
-                with count_lock:
-                    completed_count += 1
-                if progress_bar:
-                    progress_bar.update(1)
-
-        except Exception as e:
-            with count_lock:
-                failed_count += 1
-                if uploading_count > 0:
-                    uploading_count -= 1
-                if processing_count > 0:
-                    processing_count -= 1
-            if progress_bar:
-                progress_bar.write(f"Error processing {inpath.name}: {e}")
-
-    with ThreadPoolExecutor(
-        max_workers=upload_concurrency + processing_concurrency
-    ) as executor:
-        futures = [
-            executor.submit(process_file, inpath, outpath)
-            for inpath, outpath in file_pairs
-        ]
-        for future in futures:
-            future.result()
-
-    if progress_bar:
-        progress_bar.close()
+    runner = BatchRunner(
+        opts,
+        config,
+        upload_concurrency,
+        processing_concurrency,
+        progress_bar,
+        webhooks,
+    )
+    try:
+        asyncio.run(runner.run(file_pairs))
+    finally:
+        if progress_bar:
+            progress_bar.close()
 
     if show_progress:
-        print(f"\nCompleted: {completed_count}/{len(file_pairs)}")
-        if failed_count > 0:
-            print(f"Failed: {failed_count}")
+        print(f"\nCompleted: {runner.completed_count}/{len(file_pairs)}")
+        if runner.failed_count > 0:
+            print(f"Failed: {runner.failed_count}")
 
 
 @app.command()
-def list() -> None:
+def list(
+    limit: t.Annotated[
+        int, typer.Option(help="Number of most recent transcripts to list")
+    ] = TRANSCRIPT_LIST_LIMIT,
+) -> None:
     """List all transcripts"""
-    result = aai.Transcriber().list_transcripts()
-    for transcript in result.transcripts:
-        print(transcript.id, transcript.status)
+    ids = []
+    for page in _iter_transcript_pages(limit):
+        sys.stdout.write("".join(f"{item.id} {item.status}\n" for item in page))
+        sys.stdout.flush()
+        ids.extend(item.id for item in page)
+    _cache_transcript_ids(ids)
 
 
 @app.command()
@@ -952,9 +377,9 @@ def load(
     ],
 ) -> None:
     """Load a transcript by ID or index from `aait list`"""
-    if transcript_id.startswith("-") and transcript_id[1:].isdigit():
-        index = int(transcript_id[1:])
-        transcript_id = aai.Transcriber().list_transcripts().transcripts[index].id
+    import assemblyai as aai
+
+    transcript_id = _resolve_transcript_id(transcript_id)
     transcript = aai.Transcript.get_by_id(transcript_id)
     code.interact(local=locals(), banner=f"Loaded transcript {transcript_id}")
 
@@ -970,9 +395,9 @@ def delete(
     ] = False,
 ) -> None:
     """Delete a transcript from AssemblyAI servers"""
-    if transcript_id.startswith("-") and transcript_id[1:].isdigit():
-        index = int(transcript_id[1:])
-        transcript_id = aai.Transcriber().list_transcripts().transcripts[index].id
+    import assemblyai as aai
+
+    transcript_id = _resolve_transcript_id(transcript_id)
 
     if not force:
         confirm = typer.confirm(f"Delete transcript {transcript_id}?")
@@ -982,6 +407,7 @@ def delete(
 
     try:
         aai.Transcript.delete_by_id(transcript_id)
+        _cache_transcript_ids(None)
         print(f"✓ Deleted transcript {transcript_id}")
     except Exception as e:
         print(f"Error deleting transcript: {e}", file=sys.stderr)
@@ -1001,7 +427,7 @@ def version_callback(value: bool) -> None:
 @app.callback()
 def callback(
     version_flag: t.Annotated[
-        t.Optional[bool],
+        bool | None,
         typer.Option(
             "--version",
             callback=version_callback,
@@ -1011,6 +437,8 @@ def callback(
     ] = None,
 ) -> None:
     """CLI tool for AssemblyAI"""
+    import assemblyai as aai
+
     try:
         aai.settings.api_key = load_api_key()
     except RuntimeError as e:
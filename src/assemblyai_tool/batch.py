@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import typing as t
+from pathlib import Path
+
+from .client import _make_async_client
+from .output import _has_output, write_output
+from .transcription import _first_poll_delay, _submit_transcript, _wait_for_transcript
+from .upload import _RateLimiter, upload_file_with_progress
+
+if t.TYPE_CHECKING:
+    import assemblyai as aai
+    import httpx
+    from tqdm import tqdm
+
+    from .options import TranscribeOptions
+    from .webhook import _WebhookReceiver
+
+AUDIO_EXTENSIONS = frozenset(
+    {
+        ".mp3",
+        ".mp4",
+        ".m4a",
+        ".wav",
+        ".flac",
+        ".aac",
+        ".ogg",
+        ".opus",
+        ".webm",
+        ".wma",
+    }
+)
+
+
+def find_batch_files(
+    input_dir: Path, output_dir: Path, output_ext: str, force: bool
+) -> tuple[list[tuple[Path, Path]], int]:
+    """Pair audio files in input_dir with their output paths in output_dir.
+
+    Files with a non-empty output are skipped unless force is set.
+    Returns tuple of (file_pairs, skipped_count).
+    """
+    # Plain string joins; Path's / operator is slow over thousands of files
+    output_prefix = os.path.join(output_dir, "")
+    file_pairs = []
+    skipped_count = 0
+    with os.scandir(input_dir) as entries:
+        for entry in entries:
+            stem, ext = os.path.splitext(entry.name)
+            if ext.lower() not in AUDIO_EXTENSIONS or not entry.is_file():
+                continue
+            outpath = f"{output_prefix}{stem}{output_ext}"
+            if not force and _has_output(outpath):
+                skipped_count += 1
+                continue
+            file_pairs.append((Path(entry.path), Path(outpath)))
+    return file_pairs, skipped_count
+
+
+class BatchRunner:
+    """Upload files and transcribe them through a bounded queue, tallying results."""
+
+    def __init__(
+        self,
+        opts: TranscribeOptions,
+        config: aai.TranscriptionConfig,
+        upload_concurrency: int,
+        processing_concurrency: int,
+        progress_bar: tqdm | None = None,
+        webhooks: _WebhookReceiver | None = None,
+    ):
+        self.opts = opts
+        self.config = config
+        self.upload_concurrency = upload_concurrency
+        self.processing_concurrency = processing_concurrency
+        self.progress_bar = progress_bar
+        self.webhooks = webhooks
+        self.rate_limiter = None
+        if opts.rate_limit_kbps > 0 or opts.rate_limit_ratio is not None:
+            self.rate_limiter = _RateLimiter(
+                opts.rate_limit_kbps, opts.rate_limit_ratio
+            )
+        self.completed_count = 0
+        self.failed_count = 0
+        self.uploading_count = 0
+        self.processing_count = 0
+        self.first_upload_done = False
+        self.pending: t.Iterator[tuple[Path, Path]] = iter(())
+        # Bounded, so uploads run only a little ahead of the transcription jobs
+        self.uploaded: asyncio.Queue[tuple[Path, Path, str]] = asyncio.Queue(
+            maxsize=processing_concurrency
+        )
+
+    def _update_progress(self) -> None:
+        if self.progress_bar:
+            self.progress_bar.set_postfix_str(
+                f"{self.uploading_count} u/l; {self.processing_count} asr"
+            )
+
+    def _report_failure(self, inpath: Path, error: object) -> None:
+        self.failed_count += 1
+        if self.progress_bar:
+            self.progress_bar.write(f"Error processing {inpath.name}: {error}")
+
+    async def _guarded[T](self, inpath: Path, step: t.Awaitable[T]) -> T | None:
+        """Await one file's step, reporting its failure instead of raising."""
+        try:
+            return await step
+        except Exception as e:
+            self._report_failure(inpath, e)
+            return None
+
+    async def _upload_files(self, client: httpx.AsyncClient) -> None:
+        for inpath, outpath in self.pending:
+            is_first = not self.first_upload_done
+            self.uploading_count += 1
+            self._update_progress()
+            try:
+                uploaded = await self._guarded(
+                    inpath,
+                    upload_file_with_progress(
+                        client,
+                        str(inpath),
+                        False,
+                        self.opts.rate_limit_kbps,
+                        self.opts.rate_limit_ratio,
+                        is_first,
+                        self.rate_limiter,
+                    ),
+                )
+            finally:
+                self.uploading_count -= 1
+                self._update_progress()
+            if uploaded is None:
+                continue
+            upload_url, speed_kbps = uploaded
+
+            if is_first and self.rate_limiter:
+                self.rate_limiter.set_first_upload_speed(speed_kbps)
+            if is_first:
+                self.first_upload_done = True
+
+            await self.uploaded.put((inpath, outpath, upload_url))
+
+    async def _transcribe(
+        self, client: httpx.AsyncClient, inpath: Path, upload_url: str
+    ) -> aai.Transcript:
+        transcript_id = await _submit_transcript(client, upload_url, self.config)
+        if self.webhooks:
+            return await self.webhooks.wait(client, transcript_id)
+        first_delay = _first_poll_delay(inpath.stat().st_size)
+        return await _wait_for_transcript(client, transcript_id, first_delay)
+
+    async def _transcribe_to_output(
+        self, client: httpx.AsyncClient, inpath: Path, outpath: Path, upload_url: str
+    ) -> None:
+        import assemblyai as aai
+
+        transcript = await self._transcribe(client, inpath, upload_url)
+        if transcript.status == aai.TranscriptStatus.error:
+            self._report_failure(inpath, transcript.error)
+            return
+        opts = self.opts
+        write_output(transcript, opts.format, opts.speaker_labels, outpath)
+        self.completed_count += 1
+        if self.progress_bar:
+            self.progress_bar.update(1)
+
+    async def _transcribe_files(self, client: httpx.AsyncClient) -> None:
+        while True:
+            inpath, outpath, upload_url = await self.uploaded.get()
+            self.processing_count += 1
+            self._update_progress()
+            try:
+                await self._guarded(
+                    inpath,
+                    self._transcribe_to_output(client, inpath, outpath, upload_url),
+                )
+            finally:
+                self.processing_count -= 1
+                self._update_progress()
+                self.uploaded.task_done()
+
+    async def run(self, file_pairs: t.Iterable[tuple[Path, Path]]) -> None:
+        """Upload and transcribe every (inpath, outpath) pair."""
+        self.pending = iter(file_pairs)
+        server = await self.webhooks.serve() if self.webhooks else None
+        try:
+            async with _make_async_client() as client:
+                transcribers = [
+                    asyncio.create_task(self._transcribe_files(client))
+                    for _ in range(self.processing_concurrency)
+                ]
+                await asyncio.gather(
+                    *(
+                        self._upload_files(client)
+                        for _ in range(self.upload_concurrency)
+                    )
+                )
+                await self.uploaded.join()
+                for task in transcribers:
+                    task.cancel()
+        finally:
+            if server:
+                server.close()
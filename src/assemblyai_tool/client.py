@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import functools
+import typing as t
+
+if t.TYPE_CHECKING:
+    import assemblyai as aai
+    import httpx
+
+
+@functools.lru_cache(maxsize=1)
+def _default_client() -> aai.Client:
+    """The SDK's default client; settings are fixed once the CLI callback runs."""
+    import assemblyai as aai
+
+    return aai.Client.get_default()
+
+
+def _make_async_client() -> httpx.AsyncClient:
+    """Create an async client with the SDK client's base URL, auth and timeout."""
+    import httpx
+
+    http_client = _default_client().http_client
+    return httpx.AsyncClient(
+        base_url=str(http_client.base_url),
+        headers=http_client.headers,
+        timeout=http_client.timeout,
+    )
+
+
+def _is_transient(response: httpx.Response) -> bool:
+    """Whether a failed request is worth retrying."""
+    import httpx
+
+    return (
+        response.status_code >= 500
+        or response.status_code == httpx.codes.TOO_MANY_REQUESTS
+    )
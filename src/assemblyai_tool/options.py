@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import functools
+import re
+import typing as t
+from dataclasses import dataclass
+from enum import Enum
+from types import MappingProxyType
+
+if t.TYPE_CHECKING:
+    import assemblyai as aai
+
+CUSTOM_SPELLING_PAIR = re.compile(r"([^,:]+):([^,]+)")
+WORD_BOOST_SEPARATOR = re.compile(r"\s*,\s*")
+
+
+class OutputFormat(str, Enum):
+    """Output format options"""
+
+    utterances = "utterances"
+    paragraphs = "paragraphs"
+    text = "text"
+    srt = "srt"
+    vtt = "vtt"
+    json_format = "json"
+
+
+class SpeechModelChoice(str, Enum):
+    """Speech model options"""
+
+    best = "best"
+    nano = "nano"
+    slam_1 = "slam-1"
+    universal = "universal"
+
+
+class BoostParam(str, Enum):
+    """Word boost parameter options"""
+
+    low = "low"
+    default = "default"
+    high = "high"
+
+
+@dataclass
+class TranscribeOptions:
+    """Shared transcription options"""
+
+    format: OutputFormat
+    speech_model: SpeechModelChoice
+    language_code: str | None
+    language_detection: bool
+    audio_start_from: int | None
+    audio_end_at: int | None
+    punctuate: bool
+    word_boost: str | None
+    boost_param: BoostParam
+    custom_spelling: str | None
+    speaker_labels: bool
+    speakers_expected: int | None
+    sentiment_analysis: bool
+    entity_detection: bool
+    auto_chapters: bool
+    auto_highlights: bool
+    show_progress: bool
+    rate_limit_kbps: float
+    rate_limit_ratio: float | None
+
+
+@functools.lru_cache(maxsize=32)
+def parse_custom_spelling(spelling_str: str) -> t.Mapping[str, str]:
+    """Parse custom spelling string format: 'from1:to1,from2:to2'"""
+    if not spelling_str:
+        return MappingProxyType({})
+
+    pairs = (
+        (from_word.strip(), to_word.strip())
+        for from_word, to_word in CUSTOM_SPELLING_PAIR.findall(spelling_str)
+    )
+    return MappingProxyType(
+        {to_word: from_word for from_word, to_word in pairs if from_word and to_word}
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def parse_word_boost(word_boost_str: str) -> tuple[str, ...]:
+    """Parse word boost string format: 'word1,phrase two'"""
+    return tuple(WORD_BOOST_SEPARATOR.split(word_boost_str.strip()))
+
+
+def _build_config(opts: TranscribeOptions) -> aai.TranscriptionConfig:
+    """Build the SDK transcription config for the given options."""
+    import assemblyai as aai
+
+    config_params = {
+        "speech_model": aai.SpeechModel(opts.speech_model.value),
+        "punctuate": opts.punctuate,
+        "speaker_labels": opts.speaker_labels,
+        "sentiment_analysis": opts.sentiment_analysis,
+        "entity_detection": opts.entity_detection,
+        "auto_chapters": opts.auto_chapters,
+        "auto_highlights": opts.auto_highlights,
+    }
+
+    if opts.language_code:
+        config_params["language_code"] = opts.language_code
+    else:
+        config_params["language_detection"] = opts.language_detection
+
+    if opts.audio_start_from is not None:
+        config_params["audio_start_from"] = opts.audio_start_from
+    if opts.audio_end_at is not None:
+        config_params["audio_end_at"] = opts.audio_end_at
+
+    if opts.word_boost:
+        config_params["word_boost"] = parse_word_boost(opts.word_boost)
+        config_params["boost_param"] = aai.types.WordBoost(opts.boost_param.value)
+
+    custom_spelling = parse_custom_spelling(opts.custom_spelling or "")
+    if custom_spelling:
+        config_params["custom_spelling"] = custom_spelling
+
+    if opts.speakers_expected is not None:
+        config_params["speakers_expected"] = opts.speakers_expected
+
+    return aai.TranscriptionConfig(**config_params)
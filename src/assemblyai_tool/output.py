@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import os
+import typing as t
+from pathlib import Path
+
+from .options import OutputFormat
+
+if t.TYPE_CHECKING:
+    import assemblyai as aai
+
+OUTPUT_EXTENSIONS = {
+    OutputFormat.text: ".txt",
+    OutputFormat.paragraphs: ".txt",
+    OutputFormat.utterances: ".txt",
+    OutputFormat.srt: ".srt",
+    OutputFormat.vtt: ".vtt",
+    OutputFormat.json_format: ".json",
+}
+
+
+def _join_lazily(parts: t.Iterable[str], separator: str) -> t.Iterator[str]:
+    """Like separator.join(parts), but yielding pieces instead of one string."""
+    for i, part in enumerate(parts):
+        if i:
+            yield separator
+        yield part
+
+
+def format_output(
+    transcript: aai.Transcript,
+    output_format: OutputFormat,
+    speaker_labels: bool,
+) -> t.Iterator[str]:
+    """Format transcript based on output format choice, yielding output chunks."""
+
+    if output_format == OutputFormat.text:
+        yield transcript.text
+
+    elif output_format == OutputFormat.paragraphs:
+        paragraphs = transcript.get_paragraphs()
+        if speaker_labels and transcript.utterances:
+            # Group paragraphs by speaker
+            yield from _join_lazily((f"{para.text}\n" for para in paragraphs), "\n")
+        else:
+            yield from _join_lazily((p.text for p in paragraphs), "\n\n")
+
+    elif output_format == OutputFormat.srt:
+        yield transcript.export_subtitles_srt()
+
+    elif output_format == OutputFormat.vtt:
+        yield transcript.export_subtitles_vtt()
+
+    elif output_format == OutputFormat.json_format:
+        yield _json_bytes(transcript).decode()
+
+    elif transcript.utterances:
+        if speaker_labels:
+            lines = [f"Speaker {u.speaker}: {u.text}\n" for u in transcript.utterances]
+        else:
+            lines = [f"{u.text}\n" for u in transcript.utterances]
+        yield "\n".join(lines)
+
+    else:
+        yield transcript.text
+
+
+def _json_bytes(transcript: aai.Transcript) -> bytes:
+    import orjson
+
+    return orjson.dumps(transcript.json_response, option=orjson.OPT_INDENT_2)
+
+
+def write_chunks[S: (str, bytes)](
+    outpath: Path, chunks: t.Iterable[S], binary: bool = False
+) -> None:
+    """Stream chunks to outpath, which is only replaced once all are written."""
+    partial_path = outpath.with_name(f".{outpath.name}.part")
+    try:
+        with open(partial_path, "wb" if binary else "w") as f:
+            f.writelines(chunks)
+        os.replace(partial_path, outpath)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+
+
+def write_output(
+    transcript: aai.Transcript,
+    output_format: OutputFormat,
+    speaker_labels: bool,
+    outpath: Path,
+) -> None:
+    """Write transcript to outpath in the chosen output format."""
+    if output_format == OutputFormat.json_format:
+        # orjson already produces UTF-8, so skip decoding it just to re-encode it
+        write_chunks(outpath, [_json_bytes(transcript)], binary=True)
+        return
+    write_chunks(outpath, format_output(transcript, output_format, speaker_labels))
+
+
+def _has_output(outpath: str) -> bool:
+    """Whether outpath holds a non-empty result, e.g. from an earlier run."""
+    try:
+        return os.stat(outpath).st_size > 0
+    except FileNotFoundError:
+        return False
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import typing as t
+
+from .client import _default_client, _is_transient, _make_async_client
+from .upload import upload_file_with_progress
+
+if t.TYPE_CHECKING:
+    import assemblyai as aai
+    import httpx
+
+POLL_ATTEMPTS = 3
+POLL_BACKOFF = 1.5
+MAX_POLL_INTERVAL = 30.0
+# Roughly 128 kbps; uncompressed audio only makes the duration guess longer
+AUDIO_BYTES_PER_SECOND = 16 * 1024
+FIRST_POLL_FRACTION = 0.1
+MAX_FIRST_POLL_INTERVALS = 10
+
+
+async def _poll_transcript(
+    transcript_id: str,
+    client: httpx.AsyncClient,
+    delay: float,
+    etag: str | None = None,
+) -> httpx.Response:
+    """Wait delay seconds, then fetch the transcript's current state.
+
+    Transient failures are retried with doubling delays, for up to
+    POLL_ATTEMPTS tries. With an etag, an unchanged transcript comes back
+    as 304 Not Modified.
+    """
+    import assemblyai as aai
+    import httpx
+
+    headers = {"If-None-Match": etag} if etag else None
+    for attempt in range(POLL_ATTEMPTS):
+        last_attempt = attempt == POLL_ATTEMPTS - 1
+        await asyncio.sleep(delay)
+        delay = max(delay, aai.settings.polling_interval) * 2
+        try:
+            response = await client.get(
+                f"/v2/transcript/{transcript_id}", headers=headers
+            )
+        except httpx.TransportError:
+            if last_attempt:
+                raise
+        else:
+            if last_attempt or not _is_transient(response):
+                return response
+
+
+def _first_poll_delay(file_size: int) -> float:
+    """Guess how long a job needs before polling is worthwhile, from its file size.
+
+    Processing takes a fraction of the audio's duration, which is estimated
+    from the file size. The guess is kept within 1-10 polling intervals.
+    """
+    import assemblyai as aai
+
+    interval = aai.settings.polling_interval
+    estimate = file_size / AUDIO_BYTES_PER_SECOND * FIRST_POLL_FRACTION
+    return min(max(estimate, interval), interval * MAX_FIRST_POLL_INTERVALS)
+
+
+async def _wait_for_transcript(
+    client: httpx.AsyncClient,
+    transcript_id: str,
+    first_delay: float,
+    on_processing: t.Callable[[], None] = lambda: None,
+) -> aai.Transcript:
+    """Poll a submitted transcript until it completes or fails."""
+    import assemblyai as aai
+    import httpx
+    import orjson
+
+    terminal_statuses = (aai.TranscriptStatus.completed, aai.TranscriptStatus.error)
+    interval = aai.settings.polling_interval
+    started_processing = False
+    delay = first_delay
+    etag = None
+    status = None
+
+    while True:
+        response = await _poll_transcript(transcript_id, client, delay, etag)
+        delay = min(max(delay * POLL_BACKOFF, interval), MAX_POLL_INTERVAL)
+        if response.status_code == httpx.codes.OK:
+            etag = response.headers.get("ETag")
+            # Full pydantic parsing is costly, and only the final poll needs it
+            data = orjson.loads(response.content)
+            status = data["status"]
+            if status in terminal_statuses:
+                return aai.Transcript.from_response(
+                    client=_default_client(),
+                    response=aai.types.TranscriptResponse.parse_obj(data),
+                )
+        elif response.status_code != httpx.codes.NOT_MODIFIED:
+            raise RuntimeError(f"Polling transcript failed: {response.text}")
+
+        if status == aai.TranscriptStatus.processing:
+            if not started_processing:
+                started_processing = True
+                delay = interval
+            on_processing()
+
+
+async def _wait_with_progress(
+    client: httpx.AsyncClient, transcript_id: str, first_delay: float
+) -> aai.Transcript:
+    """Poll a submitted transcript until it completes, showing a progress bar."""
+    import assemblyai as aai
+    from tqdm import tqdm
+
+    processing_bar = tqdm(
+        total=100,
+        unit="%",
+        desc="Processing",
+        bar_format="{l_bar}{bar}| {n:.0f}/{total:.0f}%",
+    )
+
+    def advance() -> None:
+        if processing_bar.n == 0:
+            processing_bar.update(30)
+        elif processing_bar.n < 90:
+            processing_bar.update(10)
+
+    try:
+        transcript = await _wait_for_transcript(
+            client, transcript_id, first_delay, advance
+        )
+        if transcript.status == aai.TranscriptStatus.completed:
+            processing_bar.n = 100
+            processing_bar.refresh()
+        return transcript
+    finally:
+        processing_bar.close()
+
+
+async def _submit_transcript(
+    client: httpx.AsyncClient, upload_url: str, config: aai.TranscriptionConfig
+) -> str:
+    """Request transcription of an uploaded file, returning the transcript ID."""
+    import assemblyai as aai
+    import httpx
+
+    request = aai.types.TranscriptRequest(
+        audio_url=upload_url, **config.raw.dict(exclude_none=True)
+    )
+    response = await client.post(
+        "/v2/transcript", json=request.dict(exclude_none=True, by_alias=True)
+    )
+    if response.status_code != httpx.codes.OK:
+        raise RuntimeError(f"Transcription request failed: {response.text}")
+    return response.json()["id"]
+
+
+def make_transcript(
+    inpath: str,
+    config: aai.TranscriptionConfig,
+    show_progress: bool,
+    rate_limit_kbps: float = 0.0,
+    rate_limit_ratio: float | None = None,
+) -> aai.Transcript:
+    """Create a transcript with the specified configuration."""
+    import assemblyai as aai
+
+    async def transcribe() -> aai.Transcript:
+        async with _make_async_client() as client:
+            upload_url, _ = await upload_file_with_progress(
+                client, str(inpath), show_progress, rate_limit_kbps, rate_limit_ratio
+            )
+            transcript_id = await _submit_transcript(client, upload_url, config)
+            first_delay = _first_poll_delay(os.path.getsize(inpath))
+            if not show_progress:
+                return await _wait_for_transcript(client, transcript_id, first_delay)
+            return await _wait_with_progress(client, transcript_id, first_delay)
+
+    transcript = asyncio.run(transcribe())
+
+    if show_progress and transcript.status == aai.TranscriptStatus.completed:
+        duration_mins = (
+            transcript.audio_duration / 60 if transcript.audio_duration else 0
+        )
+        print(f"✓ Transcription complete ({duration_mins:.1f} minutes)")
+
+    return transcript
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+import typing as t
+from pathlib import Path
+
+from .client import _default_client
+from .output import write_chunks
+
+if t.TYPE_CHECKING:
+    import assemblyai as aai
+
+TRANSCRIPT_LIST_CACHE = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "assemblyai-tool"
+    / "transcripts.json"
+)
+TRANSCRIPT_LIST_CACHE_TTL = 30.0
+TRANSCRIPT_LIST_LIMIT = 10
+TRANSCRIPT_PAGE_SIZE = 100
+
+
+def _api_key_fingerprint() -> str:
+    import assemblyai as aai
+
+    return hashlib.sha256(aai.settings.api_key.encode()).hexdigest()[:16]
+
+
+def _cached_transcript_ids() -> list[str] | None:
+    """Return transcript IDs from the on-disk cache, unless stale or missing."""
+    try:
+        if (
+            time.time() - TRANSCRIPT_LIST_CACHE.stat().st_mtime
+            > TRANSCRIPT_LIST_CACHE_TTL
+        ):
+            return None
+        cached = json.loads(TRANSCRIPT_LIST_CACHE.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != _api_key_fingerprint():
+        return None
+    ids = cached.get("ids")
+    return ids if isinstance(ids, list) else None
+
+
+def _cache_transcript_ids(ids: list[str] | None) -> None:
+    """Store transcript IDs in the on-disk cache; None invalidates it."""
+    try:
+        if ids is None:
+            TRANSCRIPT_LIST_CACHE.unlink(missing_ok=True)
+            return
+        TRANSCRIPT_LIST_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        write_chunks(
+            TRANSCRIPT_LIST_CACHE,
+            [json.dumps({"key": _api_key_fingerprint(), "ids": ids})],
+        )
+    except OSError:
+        pass  # the cache is an optimisation; never fail a command over it
+
+
+def _iter_transcript_pages(
+    limit: int,
+) -> t.Iterator[list[aai.types.TranscriptItem]]:
+    """Yield pages holding up to limit transcripts in total, newest first."""
+    import assemblyai as aai
+    import httpx
+    import orjson
+
+    # ListTranscriptParameters.dict() leaks pydantic's model_config into the query
+    client = _default_client().http_client
+    params: dict[str, t.Any] = {}
+    while limit > 0:
+        params["limit"] = min(limit, TRANSCRIPT_PAGE_SIZE)
+        response = client.get("/v2/transcript", params=params)
+        if response.status_code != httpx.codes.OK:
+            raise RuntimeError(f"Listing transcripts failed: {response.text}")
+        page = aai.types.ListTranscriptResponse.parse_obj(
+            orjson.loads(response.content)
+        )
+        yield page.transcripts
+        if len(page.transcripts) < params["limit"]:
+            return
+        limit -= params["limit"]
+        params["before_id"] = page.transcripts[-1].id
+
+
+def _resolve_transcript_id(transcript_id: str) -> str:
+    """Resolve a negative integer index from `aait list` to a transcript ID."""
+    if not (transcript_id.startswith("-") and transcript_id[1:].isdigit()):
+        return transcript_id
+    index = int(transcript_id[1:])
+    ids = _cached_transcript_ids()
+    if ids is None or index >= len(ids):
+        limit = max(index + 1, TRANSCRIPT_LIST_LIMIT)
+        pages = _iter_transcript_pages(limit)
+        ids = [item.id for page in pages for item in page]
+        _cache_transcript_ids(ids)
+    return ids[index]
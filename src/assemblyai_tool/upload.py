@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import asyncio
+import mmap
+import os
+import threading
+import time
+import typing as t
+from pathlib import Path
+
+import typer
+
+from .client import _is_transient
+
+if t.TYPE_CHECKING:
+    import httpx
+    from tqdm import tqdm
+
+DEFAULT_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _upload_chunk_size() -> int:
+    """The AAIT_UPLOAD_CHUNK_SIZE override if it is a positive integer, else 1 MiB."""
+    value = os.environ.get("AAIT_UPLOAD_CHUNK_SIZE", "")
+    if value.isdigit() and int(value) > 0:
+        return int(value)
+    if value:
+        typer.echo(f"Ignoring invalid AAIT_UPLOAD_CHUNK_SIZE: {value!r}", err=True)
+    return DEFAULT_UPLOAD_CHUNK_SIZE
+
+
+UPLOAD_ATTEMPTS = 3
+UPLOAD_CHUNK_SIZE = _upload_chunk_size()
+PROGRESS_INTERVAL = 0.1
+SMALL_UPLOAD_SIZE = 8 * 1024 * 1024
+MMAP_UPLOAD_SIZE = 64 * 1024 * 1024
+
+
+class _RateLimiter:
+    """Rate limiter supporting fixed kbps limit or ratio of first upload speed."""
+
+    def __init__(self, rate_limit_kbps: float, rate_limit_ratio: float | None):
+        self.rate_limit_kbps = rate_limit_kbps
+        self.rate_limit_ratio = rate_limit_ratio
+        self.first_upload_speed_kbps = None
+        self.lock = threading.Lock()
+        self.effective_limit_kbps = None
+
+    def set_first_upload_speed(self, speed_kbps: float) -> None:
+        """Set the speed observed during first upload."""
+        with self.lock:
+            if self.first_upload_speed_kbps is None:
+                self.first_upload_speed_kbps = speed_kbps
+                if self.rate_limit_ratio is not None:
+                    self.effective_limit_kbps = speed_kbps * self.rate_limit_ratio
+
+    def get_delay_for_bytes(self, num_bytes: int) -> float:
+        """Calculate delay needed for given byte count based on current rate limit."""
+        with self.lock:
+            limit_kbps = self.rate_limit_kbps
+            if limit_kbps == 0 and self.effective_limit_kbps is not None:
+                limit_kbps = self.effective_limit_kbps
+
+            if limit_kbps == 0:
+                return 0.0
+
+            bytes_per_second = limit_kbps * 1024
+            return num_bytes / bytes_per_second
+
+    def get_limit_mbps(self) -> float | None:
+        """Get current effective rate limit in Mbps for display."""
+        with self.lock:
+            limit_kbps = self.rate_limit_kbps
+            if limit_kbps == 0 and self.effective_limit_kbps is not None:
+                limit_kbps = self.effective_limit_kbps
+
+            if limit_kbps == 0:
+                return None
+
+            return limit_kbps / 1024
+
+
+class _UploadFileReader:
+    """Chunked file reader for uploads, applying an optional rate limit."""
+
+    def __init__(
+        self,
+        file_path: str,
+        rate_limiter: _RateLimiter | None = None,
+        is_first_upload: bool = False,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ):
+        self.file = open(file_path, "rb")
+        self.size = os.path.getsize(file_path)
+        self.rate_limiter = rate_limiter
+        self.is_first_upload = is_first_upload
+        self.chunk_size = chunk_size
+        self.total_bytes_read = 0
+        self.start_time = time.time()
+        self.mm = None
+        if self.size >= MMAP_UPLOAD_SIZE:
+            # Chunks come straight from the page cache, which the kernel
+            # is told to fill ahead of a sequential reader
+            self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                self.mm.madvise(mmap.MADV_SEQUENTIAL)
+
+    def read(self, size: int = -1) -> bytes:
+        # mmap.read returns a copy, so no chunk keeps the mapping open
+        data = self.file.read(size) if self.mm is None else self.mm.read(size)
+        self.total_bytes_read += len(data)
+
+        if data and self.rate_limiter and not self.is_first_upload:
+            delay = self.rate_limiter.get_delay_for_bytes(len(data))
+            if delay > 0:
+                time.sleep(delay)
+
+        return data
+
+    def get_upload_speed_kbps(self) -> float:
+        """Calculate average upload speed in kbps."""
+        elapsed = time.time() - self.start_time
+        if elapsed == 0:
+            return 0.0
+        bytes_per_second = self.total_bytes_read / elapsed
+        return bytes_per_second / 1024
+
+    async def __aiter__(self):
+        # Disk reads and rate-limit sleeps run off the event loop, so the
+        # previous chunk keeps sending while the next one is read.
+        while chunk := await asyncio.to_thread(self.read, self.chunk_size):
+            yield chunk
+
+    def close(self):
+        if self.mm is not None:
+            self.mm.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+async def _show_upload_progress(f: _UploadFileReader, progress_bar: tqdm) -> None:
+    """Mirror an upload's read position onto its progress bar until cancelled."""
+    limit_mbps = f.rate_limiter.get_limit_mbps() if f.rate_limiter else None
+    if limit_mbps is not None:
+        progress_bar.set_postfix_str(f"{limit_mbps:.1f}M lmt", refresh=False)
+    while True:
+        progress_bar.update(f.total_bytes_read - progress_bar.n)
+        await asyncio.sleep(PROGRESS_INTERVAL)
+
+
+async def _iter_file(inpath: str) -> t.AsyncIterator[bytes]:
+    """Stream a file's chunks with no accounting, for uploads nothing observes."""
+    with await asyncio.to_thread(open, inpath, "rb") as f:
+        while chunk := await asyncio.to_thread(f.read, UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+
+def _speed_kbps(num_bytes: int, start_time: float) -> float:
+    elapsed = time.time() - start_time
+    return num_bytes / elapsed / 1024 if elapsed else 0.0
+
+
+async def _send_upload(
+    client: httpx.AsyncClient,
+    inpath: str,
+    progress_bar: tqdm | None,
+    rate_limiter: _RateLimiter | None,
+    is_first_upload: bool,
+) -> tuple[httpx.Response, float]:
+    """POST a file to the upload endpoint once.
+
+    Returns tuple of (response, speed_kbps).
+    """
+    file_size = os.path.getsize(inpath)
+    throttled = rate_limiter is not None and not is_first_upload
+
+    if file_size < SMALL_UPLOAD_SIZE and not throttled:
+        start_time = time.time()
+        content = await asyncio.to_thread(Path(inpath).read_bytes)
+        response = await client.post("/v2/upload", content=content)
+        if progress_bar:
+            progress_bar.update(file_size)
+        return response, _speed_kbps(file_size, start_time)
+
+    unobserved = progress_bar is None and rate_limiter is None
+    if unobserved and file_size < MMAP_UPLOAD_SIZE:
+        start_time = time.time()
+        response = await client.post(
+            "/v2/upload",
+            content=_iter_file(inpath),
+            headers={"Content-Length": str(file_size)},
+        )
+        return response, _speed_kbps(file_size, start_time)
+
+    with _UploadFileReader(inpath, rate_limiter, is_first_upload) as f:
+        progress = None
+        if progress_bar:
+            progress = asyncio.create_task(_show_upload_progress(f, progress_bar))
+        try:
+            # An async iterable is sent chunked unless told the length up front
+            response = await client.post(
+                "/v2/upload",
+                content=aiter(f),
+                headers={"Content-Length": str(f.size)},
+            )
+        finally:
+            if progress:
+                progress.cancel()
+                progress_bar.update(f.total_bytes_read - progress_bar.n)
+        return response, f.get_upload_speed_kbps()
+
+
+async def _post_upload(
+    client: httpx.AsyncClient,
+    inpath: str,
+    progress_bar: tqdm | None,
+    rate_limiter: _RateLimiter | None,
+    is_first_upload: bool,
+) -> tuple[httpx.Response, float]:
+    """POST a file to the upload endpoint, retrying transient failures.
+
+    Retries back off exponentially (1s, 2s, ...) for up to UPLOAD_ATTEMPTS tries.
+    Returns tuple of (response, speed_kbps).
+    """
+    import httpx
+
+    for attempt in range(UPLOAD_ATTEMPTS):
+        last_attempt = attempt == UPLOAD_ATTEMPTS - 1
+        try:
+            response, upload_speed_kbps = await _send_upload(
+                client, inpath, progress_bar, rate_limiter, is_first_upload
+            )
+        except httpx.TransportError:
+            if last_attempt:
+                raise
+        else:
+            if last_attempt or not _is_transient(response):
+                return response, upload_speed_kbps
+
+        await asyncio.sleep(2**attempt)
+        if progress_bar:
+            progress_bar.reset()
+
+
+async def _upload_async(
+    client: httpx.AsyncClient,
+    inpath: str,
+    progress_bar: tqdm | None,
+    rate_limiter: _RateLimiter | None,
+    is_first_upload: bool,
+) -> tuple[str, float]:
+    """Upload a file to AssemblyAI.
+
+    Returns tuple of (upload_url, speed_kbps).
+    """
+    import httpx
+
+    response, upload_speed_kbps = await _post_upload(
+        client, inpath, progress_bar, rate_limiter, is_first_upload
+    )
+    if response.status_code != httpx.codes.OK:
+        raise RuntimeError(f"Upload failed: {response.text}")
+    return response.json()["upload_url"], upload_speed_kbps
+
+
+async def upload_file_with_progress(
+    client: httpx.AsyncClient,
+    inpath: str,
+    show_progress: bool,
+    rate_limit_kbps: float = 0.0,
+    rate_limit_ratio: float | None = None,
+    is_first_upload: bool = False,
+    shared_rate_limiter: _RateLimiter | None = None,
+) -> tuple[str, float]:
+    """Upload a file to AssemblyAI with progress tracking.
+
+    Returns tuple of (upload_url, speed_kbps).
+    """
+    from tqdm import tqdm
+
+    file_size = os.path.getsize(inpath)
+
+    progress_bar = None
+    if show_progress:
+        progress_bar = tqdm(
+            total=file_size,
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024,
+            desc="Uploading",
+            mininterval=0.25,
+            maxinterval=1.0,
+            miniters=max(1, file_size // 200),
+        )
+
+    rate_limiter = shared_rate_limiter
+    if rate_limiter is None and (rate_limit_kbps > 0 or rate_limit_ratio is not None):
+        rate_limiter = _RateLimiter(rate_limit_kbps, rate_limit_ratio)
+
+    try:
+        return await _upload_async(
+            client, inpath, progress_bar, rate_limiter, is_first_upload
+        )
+    finally:
+        if progress_bar:
+            progress_bar.close()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import hmac
+import json
+import typing as t
+
+from .transcription import _wait_for_transcript
+
+if t.TYPE_CHECKING:
+    import assemblyai as aai
+    import httpx
+
+WEBHOOK_AUTH_HEADER = "X-AAIT-Webhook-Token"
+WEBHOOK_MAX_BODY = 64 * 1024
+# After this long without a webhook, fall back to polling
+WEBHOOK_TIMEOUT = 600.0
+
+
+class _WebhookReceiver:
+    """Minimal HTTP endpoint completing a future per transcript on its webhook."""
+
+    def __init__(self, token: str, host: str, port: int):
+        self.token = token
+        self.host = host
+        self.port = port
+        self.futures: dict[str, asyncio.Future] = {}
+        # Webhooks that beat wait() to registering their transcript
+        self.finished: set[str] = set()
+
+    def _finish(self, transcript_id: str) -> None:
+        future = self.futures.get(transcript_id)
+        if future is None:
+            self.finished.add(transcript_id)
+        elif not future.done():
+            future.set_result(None)
+
+    async def _receive(self, reader: asyncio.StreamReader) -> str:
+        """Read one webhook request, returning the HTTP status to answer with."""
+        try:
+            head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+        except (EOFError, asyncio.LimitOverrunError):
+            return "400 Bad Request"
+        headers = {
+            name.strip().lower(): value.strip()
+            for name, _, value in (
+                line.partition(":") for line in head.split("\r\n")[1:]
+            )
+        }
+        token = headers.get(WEBHOOK_AUTH_HEADER.lower(), "")
+        if not hmac.compare_digest(token.encode(), self.token.encode()):
+            return "401 Unauthorized"
+        length = headers.get("content-length", "0")
+        if not length.isdigit():
+            return "400 Bad Request"
+        if int(length) > WEBHOOK_MAX_BODY:
+            return "413 Content Too Large"
+        try:
+            body = await reader.readexactly(int(length))
+            transcript_id = json.loads(body)["transcript_id"]
+        except (EOFError, ValueError, KeyError, TypeError):
+            return "400 Bad Request"
+        if not isinstance(transcript_id, str):
+            return "400 Bad Request"
+        self._finish(transcript_id)
+        return "200 OK"
+
+    async def serve(self) -> asyncio.Server:
+        """Start listening for webhooks on host and port."""
+        return await asyncio.start_server(self.handle, host=self.host, port=self.port)
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            status = await self._receive(reader)
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Length: 0\r\n"
+                "Connection: close\r\n\r\n".encode()
+            )
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+        except OSError:
+            writer.close()  # the client went away mid-request
+
+    async def wait(
+        self, client: httpx.AsyncClient, transcript_id: str
+    ) -> aai.Transcript:
+        """Wait for a transcript's webhook, then fetch the finished transcript."""
+        if transcript_id in self.finished:
+            self.finished.discard(transcript_id)
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self.futures[transcript_id] = future
+            try:
+                await asyncio.wait_for(future, WEBHOOK_TIMEOUT)
+            except TimeoutError:
+                pass
+            finally:
+                del self.futures[transcript_id]
+        # Keeps polling if the webhook never arrived
+        return await _wait_for_transcript(client, transcript_id, 0)
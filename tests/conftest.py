@@ -0,0 +1,67 @@
+import json
+import threading
+import typing as t
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import assemblyai as aai
+import pytest
+
+from assemblyai_tool.client import _default_client
+
+
+class _FakeAPIHandler(BaseHTTPRequestHandler):
+    server: "FakeAPI"
+
+    def log_message(self, *args: t.Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self.server.requests.append((self.path, dict(self.headers)))
+        if self.server.responses:
+            status, body, headers = self.server.responses.pop(0)
+        else:
+            status, body, headers = self.server.default
+        payload = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class FakeAPI(ThreadingHTTPServer):
+    """Local HTTP server answering GETs with queued (status, body, headers)."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _FakeAPIHandler)
+        self.responses: list[tuple[int, t.Any, dict[str, str]]] = []
+        self.default: tuple[int, t.Any, dict[str, str]] = (404, {"error": "none"}, {})
+        self.requests: list[tuple[str, dict[str, str]]] = []
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def respond(self, status: int, body: t.Any = None, **headers: str) -> None:
+        self.responses.append((status, body, headers))
+
+
+@pytest.fixture
+def api_server() -> t.Iterator[FakeAPI]:
+    server = FakeAPI()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def aai_settings(monkeypatch: pytest.MonkeyPatch) -> t.Iterator[None]:
+    monkeypatch.setattr(aai.settings, "api_key", "test-key")
+    monkeypatch.setattr(aai.settings, "polling_interval", 0.01)
+    _default_client.cache_clear()
+    yield
+    _default_client.cache_clear()
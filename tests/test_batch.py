@@ -0,0 +1,36 @@
+from pathlib import Path
+
+from assemblyai_tool.batch import find_batch_files
+
+
+def make_inputs(input_dir: Path) -> None:
+    input_dir.mkdir()
+    for name in ("a.mp3", "b.WAV", "c.ogg", "notes.txt", ".mp3"):
+        (input_dir / name).write_bytes(b"audio")
+    (input_dir / "d.flac").mkdir()
+
+
+def test_finds_audio_files_and_output_paths(tmp_path):
+    make_inputs(tmp_path / "in")
+    pairs, skipped = find_batch_files(tmp_path / "in", tmp_path / "out", ".txt", False)
+    assert skipped == 0
+    assert sorted((i.name, str(o)) for i, o in pairs) == [
+        ("a.mp3", str(tmp_path / "out" / "a.txt")),
+        ("b.WAV", str(tmp_path / "out" / "b.txt")),
+        ("c.ogg", str(tmp_path / "out" / "c.txt")),
+    ]
+
+
+def test_skips_non_empty_outputs_unless_forced(tmp_path):
+    make_inputs(tmp_path / "in")
+    (tmp_path / "out").mkdir()
+    (tmp_path / "out" / "a.srt").write_text("done")
+    (tmp_path / "out" / "b.srt").touch()
+
+    pairs, skipped = find_batch_files(tmp_path / "in", tmp_path / "out", ".srt", False)
+    assert skipped == 1
+    assert sorted(i.name for i, _ in pairs) == ["b.WAV", "c.ogg"]
+
+    pairs, skipped = find_batch_files(tmp_path / "in", tmp_path / "out", ".srt", True)
+    assert skipped == 0
+    assert len(pairs) == 3
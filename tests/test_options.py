@@ -0,0 +1,20 @@
+from assemblyai_tool.options import parse_custom_spelling, parse_word_boost
+
+
+def test_custom_spelling_maps_targets_to_sources():
+    assert parse_custom_spelling("Foo:foo, x : y") == {"foo": "Foo", "y": "x"}
+
+
+def test_custom_spelling_keeps_colons_in_targets():
+    assert parse_custom_spelling("a:b:c") == {"b:c": "a"}
+
+
+def test_custom_spelling_drops_pairs_with_an_empty_side():
+    assert parse_custom_spelling("a: ,b:c") == {"c": "b"}
+    assert parse_custom_spelling(" :x,y:,z,,") == {}
+    assert parse_custom_spelling("") == {}
+
+
+def test_word_boost_splits_on_commas_and_surrounding_space():
+    assert parse_word_boost(" one, two three ,four ") == ("one", "two three", "four")
+    assert parse_word_boost("solo") == ("solo",)
@@ -0,0 +1,40 @@
+import pytest
+
+from assemblyai_tool.output import _has_output, write_chunks
+
+
+def test_write_chunks_replaces_output_atomically(tmp_path):
+    outpath = tmp_path / "out.txt"
+    outpath.write_text("old")
+    write_chunks(outpath, ["new ", "text"])
+    assert outpath.read_text() == "new text"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.txt"]
+
+
+def test_write_chunks_writes_bytes(tmp_path):
+    outpath = tmp_path / "out.json"
+    write_chunks(outpath, [b"{}", b"\n"], binary=True)
+    assert outpath.read_bytes() == b"{}\n"
+
+
+def test_write_chunks_leaves_no_partial_output_on_error(tmp_path):
+    outpath = tmp_path / "out.txt"
+    outpath.write_text("old")
+
+    def chunks():
+        yield "partial"
+        raise ValueError("formatting failed")
+
+    with pytest.raises(ValueError):
+        write_chunks(outpath, chunks())
+    assert outpath.read_text() == "old"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.txt"]
+
+
+def test_has_output_requires_a_non_empty_file(tmp_path):
+    outpath = tmp_path / "out.txt"
+    assert not _has_output(str(outpath))
+    outpath.touch()
+    assert not _has_output(str(outpath))
+    outpath.write_text("done")
+    assert _has_output(str(outpath))
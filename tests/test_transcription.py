@@ -0,0 +1,64 @@
+import asyncio
+
+import assemblyai as aai
+import httpx
+import pytest
+
+from assemblyai_tool.transcription import (
+    AUDIO_BYTES_PER_SECOND,
+    FIRST_POLL_FRACTION,
+    MAX_FIRST_POLL_INTERVALS,
+    POLL_ATTEMPTS,
+    _first_poll_delay,
+    _wait_for_transcript,
+)
+
+
+def transcript(status: str) -> dict:
+    return {"id": "abc", "status": status, "audio_url": "https://cdn/abc"}
+
+
+def wait_for_transcript(url: str) -> aai.Transcript:
+    async def wait() -> aai.Transcript:
+        async with httpx.AsyncClient(base_url=url) as client:
+            return await asyncio.wait_for(_wait_for_transcript(client, "abc", 0), 5)
+
+    return asyncio.run(wait())
+
+
+def test_missing_transcript_raises(api_server, aai_settings):
+    api_server.respond(404, {"error": "Transcript not found"})
+    with pytest.raises(RuntimeError, match="Transcript not found"):
+        wait_for_transcript(api_server.url)
+    assert len(api_server.requests) == 1
+
+
+def test_persistent_server_error_raises_after_retries(api_server, aai_settings):
+    api_server.default = (500, {"error": "boom"}, {})
+    with pytest.raises(RuntimeError, match="boom"):
+        wait_for_transcript(api_server.url)
+    assert len(api_server.requests) == POLL_ATTEMPTS
+
+
+def test_transient_error_is_retried(api_server, aai_settings):
+    api_server.respond(503, {"error": "busy"})
+    api_server.respond(200, transcript("completed"))
+    assert wait_for_transcript(api_server.url).status == aai.TranscriptStatus.completed
+
+
+def test_not_modified_reuses_last_status(api_server, aai_settings):
+    api_server.respond(200, transcript("processing"), ETag='"v1"')
+    api_server.respond(304)
+    api_server.respond(200, transcript("error") | {"error": "bad audio"})
+    result = wait_for_transcript(api_server.url)
+    assert result.status == aai.TranscriptStatus.error
+    assert result.error == "bad audio"
+    assert api_server.requests[1][1]["If-None-Match"] == '"v1"'
+
+
+def test_first_poll_delay_scales_with_file_size(monkeypatch):
+    monkeypatch.setattr(aai.settings, "polling_interval", 1.0)
+    one_minute = AUDIO_BYTES_PER_SECOND * 60
+    assert _first_poll_delay(0) == 1.0
+    assert _first_poll_delay(one_minute) == pytest.approx(60 * FIRST_POLL_FRACTION)
+    assert _first_poll_delay(one_minute * 60) == MAX_FIRST_POLL_INTERVALS
@@ -0,0 +1,62 @@
+import json
+import os
+import time
+
+import assemblyai as aai
+import pytest
+
+from assemblyai_tool import transcripts
+from assemblyai_tool.transcripts import (
+    TRANSCRIPT_LIST_CACHE_TTL,
+    _cache_transcript_ids,
+    _cached_transcript_ids,
+)
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "transcripts.json"
+    monkeypatch.setattr(transcripts, "TRANSCRIPT_LIST_CACHE", path)
+    monkeypatch.setattr(aai.settings, "api_key", "first-key")
+    return path
+
+
+def test_cache_round_trip(cache_file):
+    assert _cached_transcript_ids() is None
+    _cache_transcript_ids(["t2", "t1"])
+    assert _cached_transcript_ids() == ["t2", "t1"]
+    assert "first-key" not in cache_file.read_text()
+
+
+def test_cache_is_per_api_key(cache_file, monkeypatch):
+    _cache_transcript_ids(["t1"])
+    monkeypatch.setattr(aai.settings, "api_key", "second-key")
+    assert _cached_transcript_ids() is None
+
+
+def test_cache_expires(cache_file):
+    _cache_transcript_ids(["t1"])
+    stale = time.time() - TRANSCRIPT_LIST_CACHE_TTL - 1
+    os.utime(cache_file, (stale, stale))
+    assert _cached_transcript_ids() is None
+
+
+def test_cache_invalidation(cache_file):
+    _cache_transcript_ids(["t1"])
+    _cache_transcript_ids(None)
+    assert not cache_file.exists()
+    assert _cached_transcript_ids() is None
+
+
+@pytest.mark.parametrize("content", ["not json", "[]", "null", '{"ids": ["t1"]}'])
+def test_malformed_cache_is_a_miss(cache_file, content):
+    cache_file.parent.mkdir()
+    cache_file.write_text(content)
+    assert _cached_transcript_ids() is None
+
+
+def test_cache_without_an_id_list_is_a_miss(cache_file):
+    _cache_transcript_ids(["t1"])
+    cached = json.loads(cache_file.read_text())
+    cache_file.write_text(json.dumps({**cached, "ids": 3}))
+    assert _cached_transcript_ids() is None
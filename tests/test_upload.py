@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from assemblyai_tool import upload
+from assemblyai_tool.upload import (
+    DEFAULT_UPLOAD_CHUNK_SIZE,
+    _RateLimiter,
+    _upload_chunk_size,
+    _UploadFileReader,
+)
+
+CONTENT = bytes(range(256)) * 40
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    path = tmp_path / "audio.mp3"
+    path.write_bytes(CONTENT)
+    return str(path)
+
+
+async def collect(reader: _UploadFileReader) -> list:
+    return [chunk async for chunk in reader]
+
+
+def test_chunk_size_override(monkeypatch):
+    monkeypatch.setenv("AAIT_UPLOAD_CHUNK_SIZE", "4096")
+    assert _upload_chunk_size() == 4096
+
+
+@pytest.mark.parametrize("value", ["", "1MiB", "0", "-1"])
+def test_invalid_chunk_size_falls_back_to_default(monkeypatch, value):
+    monkeypatch.setenv("AAIT_UPLOAD_CHUNK_SIZE", value)
+    assert _upload_chunk_size() == DEFAULT_UPLOAD_CHUNK_SIZE
+
+
+def test_reader_yields_file_in_chunks(audio_file):
+    with _UploadFileReader(audio_file, chunk_size=4096) as reader:
+        chunks = asyncio.run(collect(reader))
+    assert [len(c) for c in chunks] == [4096, 4096, 2048]
+    assert b"".join(chunks) == CONTENT
+    assert reader.total_bytes_read == len(CONTENT)
+    assert reader.mm is None
+    assert reader.file.closed
+
+
+def test_large_reader_maps_file_and_unmaps_on_close(audio_file, monkeypatch):
+    monkeypatch.setattr(upload, "MMAP_UPLOAD_SIZE", len(CONTENT))
+    with _UploadFileReader(audio_file, chunk_size=4096) as reader:
+        assert reader.mm is not None
+        chunks = asyncio.run(collect(reader))
+    assert all(isinstance(c, bytes) for c in chunks)
+    assert b"".join(chunks) == CONTENT
+    assert reader.mm.closed
+    assert reader.file.closed
+
+
+def test_reader_skips_rate_limit_on_first_upload(audio_file):
+    limiter = _RateLimiter(rate_limit_kbps=0.001, rate_limit_ratio=None)
+    with _UploadFileReader(audio_file, limiter, is_first_upload=True) as reader:
+        assert reader.read() == CONTENT
@@ -0,0 +1,94 @@
+import asyncio
+
+import assemblyai as aai
+import httpx
+
+from assemblyai_tool.webhook import (
+    WEBHOOK_AUTH_HEADER,
+    WEBHOOK_MAX_BODY,
+    _WebhookReceiver,
+)
+
+TOKEN = {WEBHOOK_AUTH_HEADER: "secret"}
+
+
+async def post(url: str, **kwargs) -> int:
+    async with httpx.AsyncClient() as client:
+        return (await client.post(url, **kwargs)).status_code
+
+
+def run_receiver(scenario) -> None:
+    async def main() -> None:
+        receiver = _WebhookReceiver("secret", "127.0.0.1", 0)
+        server = await receiver.serve()
+        host, port = server.sockets[0].getsockname()[:2]
+        try:
+            await scenario(receiver, f"http://{host}:{port}/")
+        finally:
+            server.close()
+
+    asyncio.run(main())
+
+
+def test_webhook_completes_wait(api_server, aai_settings):
+    api_server.respond(200, {"id": "abc", "status": "completed", "audio_url": "u"})
+
+    async def scenario(receiver, url):
+        async with httpx.AsyncClient(base_url=api_server.url) as client:
+            waiter = asyncio.create_task(receiver.wait(client, "abc"))
+            await asyncio.sleep(0.05)
+            assert not waiter.done()
+            body = {"transcript_id": "abc", "status": "completed"}
+            assert await post(url, json=body, headers=TOKEN) == 200
+            transcript = await asyncio.wait_for(waiter, 5)
+        assert transcript.status == aai.TranscriptStatus.completed
+        assert receiver.futures == {}
+        assert len(api_server.requests) == 1
+
+    run_receiver(scenario)
+
+
+def test_webhook_before_wait_is_remembered():
+    async def scenario(receiver, url):
+        body = {"transcript_id": "abc", "status": "completed"}
+        assert await post(url, json=body, headers=TOKEN) == 200
+        assert receiver.finished == {"abc"}
+
+    run_receiver(scenario)
+
+
+def test_bad_token_is_rejected():
+    async def scenario(receiver, url):
+        future = asyncio.get_running_loop().create_future()
+        receiver.futures["abc"] = future
+        body = {"transcript_id": "abc"}
+        headers = {WEBHOOK_AUTH_HEADER: "wrong"}
+        assert await post(url, json=body, headers=headers) == 401
+        assert await post(url, json=body) == 401
+        assert not future.done()
+
+    run_receiver(scenario)
+
+
+def test_malformed_request_is_rejected():
+    async def scenario(receiver, url):
+        assert await post(url, content=b"not json", headers=TOKEN) == 400
+        assert await post(url, json={"id": "abc"}, headers=TOKEN) == 400
+        assert await post(url, json={"transcript_id": 1}, headers=TOKEN) == 400
+        host, port = url[len("http://") : -1].split(":")
+        reader, writer = await asyncio.open_connection(host, int(port))
+        writer.write(b"POST / HTTP/1.1\r\nContent-Le")
+        writer.write_eof()
+        assert (await reader.read()).startswith(b"HTTP/1.1 400")
+        writer.close()
+        assert receiver.finished == set()
+
+    run_receiver(scenario)
+
+
+def test_oversized_body_is_rejected():
+    async def scenario(receiver, url):
+        body = b"x" * (WEBHOOK_MAX_BODY + 1)
+        assert await post(url, content=body, headers=TOKEN) == 413
+
+    run_receiver(scenario)